@@ -6,40 +6,47 @@ A comprehensive tool for managing scripts and binaries with rich interactive int
 
 import os
 import sys
-import argparse
+import copy
+import hashlib
+import json
+import operator
 import yaml
-import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
-import subprocess
+from functools import lru_cache
+from types import SimpleNamespace
 import re
 
-# Third-party imports
+# Prefer the libyaml C bindings when available (5-15x faster parse/emit)
 try:
-    from rich.console import Console
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Third-party imports. Only the rich pieces every command needs are
+# imported here; inquirer (and its readline/blessed dependencies) is
+# imported lazily inside the interactive methods so one-shot invocations
+# like --help or --stats don't pay its startup cost.
+try:
+    from rich.console import Console, Group
     from rich.table import Table
     from rich.tree import Tree
     from rich.panel import Panel
-    from rich.box import ROUNDED, SQUARE
-    from rich import print as rprint
+    from rich.box import ROUNDED
     from rich.text import Text
-    from rich.columns import Columns
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.prompt import Prompt, Confirm, IntPrompt
-    from rich.syntax import Syntax
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.align import Align
-    import inquirer
-    from inquirer.themes import GreenPassion
 except ImportError as e:
     print(f"Error: Missing required dependency - {e}")
     print("Please install required packages:")
     print("pip install rich>=12.0.0 inquirer>=2.8.0 PyYAML>=6.0")
     sys.exit(1)
 
+# Process-local cache of parsed tool lists, keyed on (path, mtime_ns, size)
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], List[Tool]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 # Tool category enumeration
 class Category(Enum):
     STARTUP = "startup"
@@ -50,7 +57,95 @@ class Status(Enum):
     ENABLED = "enabled"
     DISABLED = "disabled"
 
-@dataclass
+# Hoisted enum values so hot loops skip the descriptor lookup
+_CAT_STARTUP = Category.STARTUP.value
+_CAT_TOOL = Category.TOOL.value
+
+# Static text fragments shared by every tree row (see TmngManager._build_tree)
+_TEXT_SPACE = Text(" ")
+_TEXT_OPEN = Text(" (", "dim")
+_TEXT_CLOSE = Text(")", "dim")
+_TEXT_DASH = Text(" - ", "dim")
+
+# Alias validation, compiled once: inquirer invokes the validator on
+# every keystroke, so no per-call charset scans or regex recompiles
+_ALIAS_RE = re.compile(r'^[^/\\:?*"<>|\s][^/\\:?*"<>|]*$')
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+
+def _validate_alias(_, current: str) -> bool:
+    """Inquirer validator: non-empty, no path separators or shell metacharacters."""
+    return bool(_ALIAS_RE.match(current))
+
+def _validate_tool_path(_, current: str) -> bool:
+    """Inquirer validator: the entered tool path must exist on submit."""
+    return bool(current) and os.path.lexists(os.path.expanduser(current))
+
+# Process-wide Console shared by the config and manager layers, so each
+# invocation only pays terminal detection once
+_shared_console: Optional[Console] = None
+
+def _get_console() -> Console:
+    global _shared_console
+    if _shared_console is None:
+        _shared_console = Console()
+    return _shared_console
+
+_HELP_TEXT = """
+tmng is a tool manager for organizing and managing your scripts and binaries.
+
+[bold cyan]Usage:[/bold cyan]
+  tmng [command] [options]
+
+[bold cyan]Commands:[/bold cyan]
+  [bold]no command[/bold]         Show this help message
+  [bold]-h, --help[/bold]         Show this help message
+  [bold]-l, --list[/bold]         List all tools with interactive management
+  [bold]-a, --add[/bold]          Add new tool(s) to the manager
+  [bold]-s, --stats[/bold]        Show statistics about managed tools
+  [bold]--update-shell[/bold]     Update shell configuration manually
+  [bold]--config PATH[/bold]      Use alternative config file
+
+[bold cyan]Examples:[/bold cyan]
+  tmng -l                    List and manage tools
+  tmng -a                   Add new tool
+  tmng --stats              Show tool statistics
+  tmng --config ~/my-tools.yaml  Use custom config file
+        """
+
+def _header_panel() -> Panel:
+    """Build the tmng header panel."""
+    header = Text.assemble(
+        ("tmng ", "bold cyan"),
+        ("Tool Manager", "bold white"),
+        (" v1.0", "dim cyan")
+    )
+    return Panel(header, border_style="cyan", padding=(1, 2))
+
+def print_help() -> None:
+    """Print the help screen.
+
+    Module-level so main() can show help without constructing a
+    TmngManager (and with it the whole config load) first.
+    """
+    console = _get_console()
+    if console.is_terminal:
+        console.clear()
+    console.print(_header_panel())
+    console.print(_HELP_TEXT)
+
+# Flat serialization schema for Tool rows (see _serialize_tools)
+_TOOL_KEYS = ("name", "alias", "category", "group", "path", "description", "enabled")
+_TOOL_GETTER = operator.attrgetter(*_TOOL_KEYS)
+
+def _serialize_tools(tools: "List[Tool]") -> List[Dict]:
+    """Serialize tools in bulk via attrgetter rather than per-tool to_dict calls."""
+    rows = [dict(zip(_TOOL_KEYS, _TOOL_GETTER(tool))) for tool in tools]
+    for row in rows:
+        if row["group"] is None:
+            row["group"] = "None"
+    return rows
+
+@dataclass(slots=True)
 class Tool:
     """Data class representing a managed tool."""
     name: str
@@ -77,16 +172,14 @@ class Tool:
     def from_dict(cls, data: Dict) -> "Tool":
         """Create Tool instance from dictionary."""
         group = data.get("group")
-        if group == "None":
-            group = None
         return cls(
-            name=data["name"],
-            alias=data["alias"],
-            category=data["category"],
-            group=group,
-            path=data.get("path", ""),
-            description=data.get("description", ""),
-            enabled=data.get("enabled", True)
+            data["name"],
+            data["alias"],
+            data["category"],
+            None if group == "None" else group,
+            data.get("path", ""),
+            data.get("description", ""),
+            data.get("enabled", True)
         )
 
 def get_project_root(config_path: Optional[Path] = None) -> Path:
@@ -123,7 +216,7 @@ class TmngConfig:
     """Configuration manager for tmng."""
     
     def __init__(self, config_path: Optional[Path] = None):
-        self.console = Console()
+        self.console = _get_console()
         
         if config_path is None:
             project_root = get_project_root()
@@ -133,7 +226,14 @@ class TmngConfig:
         
         self.config_path = config_path.resolve()
         self.project_root = project_root.resolve()
-        
+
+        # project_root is already resolved, so these are absolute without
+        # any further resolve() syscalls
+        self.startup_dir = self.project_root / "startup"
+        self.tool_dir = self.project_root / "tool"
+        self.bin_dir = self.project_root / "bin"
+        self.shell_conf_path = self.project_root / "shell.conf"
+
         ensure_project_directories(self.project_root)
         
         self._change_to_project_root()
@@ -142,6 +242,24 @@ class TmngConfig:
         self.console.print(f"[dim]Config path: {self.config_path}[/dim]")
         
         self.tools: List[Tool] = []
+        self._dirty = False
+        # Bumped on every mutation so views can cache derived state
+        self.version = 0
+        self._groups_cache: Optional[List[str]] = None
+        # O(1) duplicate checks for the add flow; kept in sync by
+        # add_tool/remove_tool/remove_group and rebuilt on load
+        self._alias_index: Dict[str, Tool] = {}
+        self._name_index: set = set()
+        # Next free suffix per base name, so batch adds of foo, foo_1, ...
+        # don't re-probe the whole run of taken suffixes each time
+        self._name_suffix_counter: Dict[str, int] = {}
+        # Digest of the last reconciled symlink set; lets update_symlinks
+        # skip the directory walk when nothing changed since the last run
+        self._symlink_state_hash: Optional[bytes] = None
+        # Memoized alias lookups; version is part of the key, so mutations
+        # (which bump self.version via mark_dirty) invalidate stale entries
+        # and old ones fall out of the LRU
+        self._alias_lookup = lru_cache(maxsize=256)(self._alias_index_get)
         self.load_config()
     
     def _change_to_project_root(self) -> None:
@@ -153,48 +271,170 @@ class TmngConfig:
             self.console.print(f"[yellow]Warning: Could not change to project root: {e}[/yellow]")
             self.console.print(f"[yellow]Continuing in current directory: {current_dir}[/yellow]")
     
+    @property
+    def groups(self) -> List[str]:
+        """Sorted unique group names, cached until the next mutation."""
+        if self._groups_cache is None:
+            self._groups_cache = sorted({t.group for t in self.tools if t.group})
+        return self._groups_cache
+
     def load_config(self) -> None:
         """Load configuration from YAML file."""
+        self._groups_cache = None
         if not self.config_path.exists():
             self.console.print(f"[yellow]Config file not found, creating default at: {self.config_path}[/yellow]")
             self._create_default_config()
             return
         
         try:
-            with open(self.config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
-            
-            self.tools = [
-                Tool.from_dict(tool_data) 
-                for tool_data in config_data.get("tools", [])
-            ]
-            
+            st = self.config_path.stat()
+            cache_key = (str(self.config_path), st.st_mtime_ns, st.st_size)
+
+            if cache_key in _YAML_CACHE:
+                # Unchanged since last parse in this process
+                _YAML_CACHE.move_to_end(cache_key)
+                self.tools = copy.deepcopy(_YAML_CACHE[cache_key])
+                self._rebuild_indexes()
+                return
+
+            tools = self._load_tools_cache(st)
+            if tools is None:
+                with open(self.config_path, 'r') as f:
+                    config_data = yaml.load(f, Loader=_YamlLoader) or {}
+
+                tools = [
+                    Tool.from_dict(tool_data)
+                    for tool_data in config_data.get("tools", [])
+                ]
+                self._write_tools_cache(st, tools)
+
+            self.tools = tools
+            self._rebuild_indexes()
+            _YAML_CACHE[cache_key] = copy.deepcopy(tools)
+            while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+
         except yaml.YAMLError as e:
+            # Leave the broken file on disk for the user to repair rather
+            # than silently overwriting it with an empty default config
             self.console.print(f"[bold red]Error loading config: {e}[/bold red]")
-            self._create_default_config()
+            self.console.print(f"[yellow]Leaving {self.config_path} untouched; fix it or remove it to start fresh.[/yellow]")
+            self.tools = []
+            self._rebuild_indexes()
         except Exception as e:
             self.console.print(f"[bold red]Unexpected error loading config: {e}[/bold red]")
-            self._create_default_config()
+            self.tools = []
+            self._rebuild_indexes()
     
+    def _load_tools_cache(self, st: os.stat_result) -> Optional[List[Tool]]:
+        """Load tools from the JSON sidecar if it matches the YAML's mtime/size."""
+        cache_path = self.config_path.with_suffix(".yaml.json")
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get("yaml_mtime_ns") == st.st_mtime_ns and data.get("yaml_size") == st.st_size:
+                return [Tool.from_dict(tool_data) for tool_data in data.get("tools", [])]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_tools_cache(self, st: os.stat_result, tools: List[Tool]) -> None:
+        """Write the JSON sidecar keyed on the YAML's mtime/size."""
+        cache_path = self.config_path.with_suffix(".yaml.json")
+        data = {
+            "yaml_mtime_ns": st.st_mtime_ns,
+            "yaml_size": st.st_size,
+            "tools": _serialize_tools(tools)
+        }
+        try:
+            with open(cache_path, 'w') as f:
+                json.dump(data, f)
+        except OSError as e:
+            self.console.print(f"[yellow]Warning: Could not write cache file: {e}[/yellow]")
+
     def _create_default_config(self) -> None:
         """Create default configuration."""
         self.tools = []
-        self.save_config()
-    
-    def save_config(self) -> None:
-        """Save configuration to YAML file."""
-        config_data = {
-            "version": "1.0",
-            "tools": [tool.to_dict() for tool in self.tools]
-        }
-        
+        self._rebuild_indexes()
+        self._flush()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the alias/name lookup indexes from the tool list."""
+        self._alias_index = {t.alias: t for t in self.tools}
+        self._name_index = {t.name for t in self.tools}
+        self._name_suffix_counter.clear()
+
+    def _alias_index_get(self, alias: str, version: int) -> Optional[Tool]:
+        # version is unused here; it only widens the cache key so stale
+        # entries stop matching after a mutation
+        return self._alias_index.get(alias)
+
+    def get_tool_by_alias(self, alias: str) -> Optional[Tool]:
+        """Look up a tool by alias through the memoized index."""
+        return self._alias_lookup(alias, self.version)
+
+    def add_tool(self, tool: Tool) -> None:
+        """Add a tool, keeping the lookup indexes in sync."""
+        self.tools.append(tool)
+        self._alias_index[tool.alias] = tool
+        self._name_index.add(tool.name)
+        self.mark_dirty()
+
+    def remove_tool(self, name: str) -> None:
+        """Remove the tool with the given name, if present."""
+        removed = [t for t in self.tools if t.name == name]
+        if not removed:
+            return
+        self.tools = [t for t in self.tools if t.name != name]
+        for t in removed:
+            self._alias_index.pop(t.alias, None)
+            self._name_index.discard(t.name)
+        self.mark_dirty()
+
+    def remove_group(self, group: str) -> None:
+        """Remove every tool in the given group."""
+        removed = [t for t in self.tools if t.group == group]
+        if not removed:
+            return
+        self.tools = [t for t in self.tools if t.group != group]
+        for t in removed:
+            self._alias_index.pop(t.alias, None)
+            self._name_index.discard(t.name)
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Record a pending mutation without writing anything to disk."""
+        self._dirty = True
+        self.version += 1
+        self._groups_cache = None
+
+    def flush(self) -> None:
+        """Write pending mutations to disk, if any."""
+        if self._dirty:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Save configuration to YAML file and refresh symlinks/shell config."""
+        self._dirty = False
+        rows = _serialize_tools(self.tools)
+
         # Ensure config directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
-            
+                # Write the scalar header directly and hand only the tools
+                # list to the emitter, so it never walks the outer mapping.
+                # Output is byte-identical to dumping the full dict.
+                f.write("version: '1.0'\n")
+                if rows:
+                    f.write("tools:\n")
+                    yaml.dump(rows, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+                else:
+                    f.write("tools: []\n")
+
+            self._write_tools_cache(self.config_path.stat(), self.tools)
+
             self.update_symlinks()
             self.update_shell_conf()
         except Exception as e:
@@ -203,77 +443,113 @@ class TmngConfig:
     def update_symlinks(self) -> None:
         """Update symbolic links in startup and tool directories."""
         # Create directories if they don't exist
-        startup_dir = self.project_root / "startup"
-        tool_dir = self.project_root / "tool"
-        bin_dir = self.project_root / "bin"
-        
-        for directory in [startup_dir, tool_dir, bin_dir]:
+        startup_dir = self.startup_dir
+        tool_dir = self.tool_dir
+
+        for directory in [startup_dir, tool_dir, self.bin_dir]:
             directory.mkdir(exist_ok=True)
         
-        # Clear existing symlinks
-        for directory in [startup_dir, tool_dir]:
-            for item in directory.iterdir():
-                if item.is_symlink():
-                    try:
-                        item.unlink()
-                    except Exception as e:
-                        self.console.print(f"[yellow]Warning: Could not remove symlink {item}: {e}[/yellow]")
-        
-        # Create new symlinks
+        # Compute the desired symlink set: (directory, alias) -> resolved target.
+        # Resolution/chmod results are memoized so tools sharing a path are
+        # only stat'd once per save.
+        desired: Dict[Tuple[Path, str], Path] = {}
+        resolved_cache: Dict[str, Optional[Path]] = {}
         for tool in self.tools:
             if not tool.enabled:
                 continue
-            
+
             # Expand user home directory in path
             tool_path_str = tool.path.strip()
             if not tool_path_str:
                 continue
-                
-            tool_path = Path(tool_path_str).expanduser()
-            
-            if not tool_path.exists():
-                self.console.print(f"[yellow]Warning: Tool path does not exist: {tool_path}[/yellow]")
-                continue
-            
-            # Determine target directory
-            target_dir = startup_dir if tool.category == Category.STARTUP.value else tool_dir
-            
-            # Create symlink
-            symlink_path = target_dir / tool.alias
-            try:
-                if symlink_path.exists() or symlink_path.is_symlink():
-                    if symlink_path.is_symlink():
-                        symlink_path.unlink()
-                    elif symlink_path.exists():
-                        # Remove if it's a regular file
-                        symlink_path.unlink()
-                
-                # Make the symlink
-                symlink_path.symlink_to(tool_path.resolve())
-                
-                # Make executable if it's a script
-                if tool_path.suffix in ['.sh', '.py'] and tool_path.exists():
+
+            if tool_path_str in resolved_cache:
+                resolved = resolved_cache[tool_path_str]
+                if resolved is None:
+                    continue
+            else:
+                tool_path = Path(tool_path_str).expanduser()
+
+                if not tool_path.exists():
+                    self.console.print(f"[yellow]Warning: Tool path does not exist: {tool_path}[/yellow]")
+                    resolved_cache[tool_path_str] = None
+                    continue
+
+                resolved = tool_path.resolve()
+                resolved_cache[tool_path_str] = resolved
+
+                # Make executable if it's a script, skipping the chmod when
+                # the execute bits are already set
+                if tool_path.suffix in ['.sh', '.py']:
                     try:
-                        tool_path.chmod(0o755)
+                        st = tool_path.stat()
+                        if st.st_mode & 0o111 == 0:
+                            tool_path.chmod(st.st_mode | 0o755)
                     except Exception as e:
                         self.console.print(f"[yellow]Warning: Could not make {tool_path} executable: {e}[/yellow]")
-                
+
+            # Determine target directory
+            target_dir = startup_dir if tool.category == _CAT_STARTUP else tool_dir
+            desired[(target_dir, tool.alias)] = resolved
+
+        # Hash the desired set; when it matches what was last reconciled the
+        # directories are already in sync and the whole walk can be skipped
+        state = hashlib.blake2b(digest_size=16)
+        for (target_dir, alias), target in sorted(
+                desired.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+            state.update(f"{target_dir}\0{alias}\0{target}\n".encode())
+        digest = state.digest()
+        if digest == self._symlink_state_hash:
+            return
+
+        # Remove stale or retargeted symlinks; keep ones already pointing at
+        # the right target so unchanged tools cost no syscalls
+        for directory in [startup_dir, tool_dir]:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # DirEntry caches the d_type, so this costs no extra stat
+                    if not entry.is_symlink():
+                        continue
+                    try:
+                        current_target = os.readlink(entry.path)
+                    except OSError:
+                        current_target = None
+                    wanted = desired.get((directory, entry.name))
+                    if wanted is not None and current_target == str(wanted):
+                        del desired[(directory, entry.name)]
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                    except Exception as e:
+                        self.console.print(f"[yellow]Warning: Could not remove symlink {entry.path}: {e}[/yellow]")
+
+        # Create the missing symlinks, using os-level calls to skip the
+        # pathlib dispatch overhead per operation
+        had_errors = False
+        for (target_dir, alias), target in desired.items():
+            link_path = os.path.join(str(target_dir), alias)
+            try:
+                if os.path.lexists(link_path):
+                    # Remove whatever is squatting on the alias
+                    os.unlink(link_path)
+
+                os.symlink(str(target), link_path)
             except Exception as e:
-                self.console.print(f"[red]Error creating symlink for {tool.alias}: {e}[/red]")
+                had_errors = True
+                self.console.print(f"[red]Error creating symlink for {alias}: {e}[/red]")
+
+        # Only remember a cleanly reconciled state; a failed link keeps the
+        # hash unset so the next run retries instead of skipping
+        self._symlink_state_hash = None if had_errors else digest
     
     def update_shell_conf(self) -> None:
         """Update shell configuration file."""
-        shell_conf = self.project_root / "shell.conf"
-        
-        # Get absolute paths
-        try:
-            startup_dir = (self.project_root / "startup").resolve()
-            tool_dir = (self.project_root / "tool").resolve()
-            bin_dir = (self.project_root / "bin").resolve()
-        except Exception as e:
-            self.console.print(f"[red]Error resolving paths: {e}[/red]")
-            return
-        
+        # All of these are precomputed absolute paths
+        shell_conf = self.shell_conf_path
+        startup_dir = self.startup_dir
+        tool_dir = self.tool_dir
+        bin_dir = self.bin_dir
+
         # Build shell configuration
         lines = [
             "# tmng shell configuration - DO NOT EDIT MANUALLY",
@@ -293,13 +569,22 @@ class TmngConfig:
             ""
         ]
         
+        new_content = '\n'.join(lines)
+
         try:
-            with open(shell_conf, 'w') as f:
-                f.write('\n'.join(lines))
-            
-            # Make shell.conf executable
-            shell_conf.chmod(0o755)
-            
+            # Skip the write (and cache invalidation) when nothing changed
+            try:
+                old_content = shell_conf.read_text()
+            except FileNotFoundError:
+                old_content = None
+
+            if old_content != new_content:
+                with open(shell_conf, 'w') as f:
+                    f.write(new_content)
+
+                # Make shell.conf executable
+                shell_conf.chmod(0o755)
+
             # Check and update .bashrc/.zshrc
             self._update_shell_init_files()
         except Exception as e:
@@ -312,79 +597,106 @@ class TmngConfig:
             Path.home() / ".zshrc",
         ]
         
-        shell_conf_path = (self.project_root / "shell.conf").resolve()
+        shell_conf_path = self.shell_conf_path
         source_line = f'\nsource "{shell_conf_path}"\n'
-        
+        stamp_path = self.project_root / ".shellinit.stamp"
+
+        # The scan is idempotent after the first run; a stamp recording the
+        # rc-file mtimes lets later saves skip reading the rc files entirely
+        mtimes = self._shell_init_mtimes(shell_init_files)
+        if self._shell_init_stamp_fresh(stamp_path, shell_conf_path, mtimes):
+            return
+
         for shell_file in shell_init_files:
             if not shell_file.exists():
                 continue
-            
+
             try:
                 with open(shell_file, 'r') as f:
                     content = f.read()
-                
+
                 # Check if already sourced
                 if str(shell_conf_path) in content:
                     continue
-                
+
                 # Append source line
                 with open(shell_file, 'a') as f:
                     f.write(source_line)
-                
+
                 self.console.print(f"[green]Updated {shell_file.name}[/green]")
-                
+
             except Exception as e:
                 self.console.print(f"[yellow]Could not update {shell_file.name}: {e}[/yellow]")
 
+        # Re-stat after any appends so the stamp reflects the final mtimes
+        stamp = {
+            "shell_conf": str(shell_conf_path),
+            "mtimes": self._shell_init_mtimes(shell_init_files)
+        }
+        try:
+            with open(stamp_path, 'w') as f:
+                json.dump(stamp, f)
+        except OSError as e:
+            self.console.print(f"[yellow]Warning: Could not write shell init stamp: {e}[/yellow]")
+
+    @staticmethod
+    def _shell_init_mtimes(shell_init_files: List[Path]) -> Dict[str, int]:
+        """Collect mtimes (ns) of the shell init files that exist."""
+        mtimes = {}
+        for shell_file in shell_init_files:
+            try:
+                mtimes[str(shell_file)] = shell_file.stat().st_mtime_ns
+            except OSError:
+                continue
+        return mtimes
+
+    @staticmethod
+    def _shell_init_stamp_fresh(stamp_path: Path, shell_conf_path: Path, mtimes: Dict[str, int]) -> bool:
+        """Check whether the stamp still matches the rc files on disk."""
+        try:
+            with open(stamp_path, 'r') as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return stamp.get("shell_conf") == str(shell_conf_path) and stamp.get("mtimes") == mtimes
+
 class TmngManager:
     """Main manager class for tmng tool."""
     
     def __init__(self, config_path: Optional[Path] = None):
-        self.console = Console()
+        self.console = _get_console()
         self.config = TmngConfig(config_path)
-        self.theme = GreenPassion()
-    
+        self._theme = None
+        # Reusable question lists for _add_single_tool, built on first use
+        # (none of their parameters depend on per-call state)
+        self._q_add_tool: Optional[list] = None
+        self._q_confirm_add: Optional[list] = None
+        # Tree view cached against the config version (see list_tools_interactive)
+        self._tree_cache: Optional[Tree] = None
+        self._tree_version = -1
+
+    @property
+    def theme(self):
+        """Inquirer theme, created lazily with the first interactive prompt."""
+        if self._theme is None:
+            from inquirer.themes import GreenPassion
+            self._theme = GreenPassion()
+        return self._theme
+
     def clear_screen(self):
         """Clear the screen in a cross-platform way."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # One home+erase control write instead of forking cls/clear per
+        # repaint; skip entirely when output isn't a terminal
+        if self.console.is_terminal:
+            self.console.clear()
     
     def print_header(self) -> None:
         """Print tmng header."""
-        header = Text.assemble(
-            ("tmng ", "bold cyan"),
-            ("Tool Manager", "bold white"),
-            (" v1.0", "dim cyan")
-        )
-        self.console.print(Panel(header, border_style="cyan", padding=(1, 2)))
-    
+        self.console.print(_header_panel())
+
     def print_help(self) -> None:
         """Print help information."""
-        self.clear_screen()
-        self.print_header()
-        
-        help_text = """
-tmng is a tool manager for organizing and managing your scripts and binaries.
-
-[bold cyan]Usage:[/bold cyan]
-  tmng [command] [options]
-
-[bold cyan]Commands:[/bold cyan]
-  [bold]no command[/bold]         Show this help message
-  [bold]-h, --help[/bold]         Show this help message
-  [bold]-l, --list[/bold]         List all tools with interactive management
-  [bold]-a, --add[/bold]          Add new tool(s) to the manager
-  [bold]-s, --stats[/bold]        Show statistics about managed tools
-  [bold]--update-shell[/bold]     Update shell configuration manually
-  [bold]--config PATH[/bold]      Use alternative config file
-
-[bold cyan]Examples:[/bold cyan]
-  tmng -l                    List and manage tools
-  tmng -a                   Add new tool
-  tmng --stats              Show tool statistics
-  tmng --config ~/my-tools.yaml  Use custom config file
-        """
-        
-        self.console.print(help_text)
+        print_help()
     
     def show_statistics(self) -> None:
         """Display statistics about managed tools."""
@@ -397,19 +709,22 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             self.console.print("[yellow]No tools managed yet. Use 'tmng -a' to add some.[/yellow]")
             return
         
-        # Calculate statistics
+        # Calculate statistics in a single pass over the tool list
         total_tools = len(tools)
-        enabled_tools = sum(1 for t in tools if t.enabled)
-        disabled_tools = total_tools - enabled_tools
-        
-        startup_tools = sum(1 for t in tools if t.category == Category.STARTUP.value)
-        tool_tools = sum(1 for t in tools if t.category == Category.TOOL.value)
-        
-        # Group by category
-        groups = {}
+        enabled_tools = 0
+        startup_tools = 0
+        tool_tools = 0
+        groups: Dict[str, int] = {}
         for tool in tools:
+            if tool.enabled:
+                enabled_tools += 1
+            if tool.category == _CAT_STARTUP:
+                startup_tools += 1
+            elif tool.category == _CAT_TOOL:
+                tool_tools += 1
             if tool.group:
                 groups[tool.group] = groups.get(tool.group, 0) + 1
+        disabled_tools = total_tools - enabled_tools
         
         # Create statistics table
         table = Table(title="tmng Statistics", box=ROUNDED, border_style="cyan")
@@ -430,26 +745,72 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             table.add_row("Regular Tools", "0", "0%")
         
         table.add_row("Tool Groups", str(len(groups)), "")
-        
-        self.console.print(table)
-        
+
+        renderables = [table]
+
         # Show group breakdown if there are groups
         if groups:
-            self.console.print("\n[bold cyan]Groups Breakdown:[/bold cyan]")
             group_table = Table(box=ROUNDED, border_style="blue")
             group_table.add_column("Group", style="blue")
             group_table.add_column("Tool Count", style="green", justify="right")
-            
+
             for group_name, count in sorted(groups.items()):
                 group_table.add_row(group_name, str(count))
-            
-            self.console.print(group_table)
-        
-        self.console.print("\n[dim]Press Enter to continue...[/dim]")
+
+            renderables.append("\n[bold cyan]Groups Breakdown:[/bold cyan]")
+            renderables.append(group_table)
+
+        renderables.append("\n[dim]Press Enter to continue...[/dim]")
+
+        # One render + one terminal write for the whole screen
+        self.console.print(Group(*renderables))
         input()
     
+    def _build_tree(self) -> Tree:
+        """Build the grouped tree view of all managed tools."""
+        tree = Tree("[bold cyan]Managed Tools[/bold cyan]", guide_style="cyan")
+
+        # Group tools by group
+        grouped_tools = {}
+        for tool in self.config.tools:
+            group = tool.group or "Ungrouped"
+            if group not in grouped_tools:
+                grouped_tools[group] = []
+            grouped_tools[group].append(tool)
+
+        # Build tree
+        for group_name in sorted(grouped_tools.keys()):
+            if group_name == "Ungrouped":
+                group_node = tree.add(f"[dim]{group_name}[/dim]")
+            else:
+                group_node = tree.add(f"[bold blue]{group_name}[/bold blue]")
+
+            for tool in sorted(grouped_tools[group_name], key=lambda x: x.name):
+                status_icon = "●"  # 小圆点
+                status_color = "green" if tool.enabled else "red"
+
+                category_icon = "⚡" if tool.category == _CAT_STARTUP else "🛠️"
+
+                tool_text = Text()
+                tool_text.append(status_icon, status_color)
+                tool_text.append_text(_TEXT_SPACE)
+                tool_text.append(category_icon)
+                tool_text.append_text(_TEXT_SPACE)
+                tool_text.append(tool.alias, "bold green" if tool.enabled else "dim red")
+                tool_text.append_text(_TEXT_OPEN)
+                tool_text.append(tool.name, "dim cyan")
+                tool_text.append_text(_TEXT_CLOSE)
+                tool_text.append_text(_TEXT_DASH)
+                tool_text.append(tool.description, "white")
+
+                group_node.add(tool_text)
+
+        return tree
+
     def list_tools_interactive(self) -> None:
         """Display tools in interactive list with management options."""
+        import inquirer
+
         if not self.config.tools:
             self.clear_screen()
             self.print_header()
@@ -459,47 +820,13 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
         while True:
             self.clear_screen()
             self.print_header()
-            
-            # Create tree view
-            tree = Tree("[bold cyan]Managed Tools[/bold cyan]", guide_style="cyan")
-            
-            # Group tools by group
-            grouped_tools = {}
-            for tool in self.config.tools:
-                group = tool.group or "Ungrouped"
-                if group not in grouped_tools:
-                    grouped_tools[group] = []
-                grouped_tools[group].append(tool)
-            
-            # Build tree
-            for group_name in sorted(grouped_tools.keys()):
-                if group_name == "Ungrouped":
-                    group_node = tree.add(f"[dim]{group_name}[/dim]")
-                else:
-                    group_node = tree.add(f"[bold blue]{group_name}[/bold blue]")
-                
-                for tool in sorted(grouped_tools[group_name], key=lambda x: x.name):
-                    status_icon = "●"  # 小圆点
-                    status_color = "green" if tool.enabled else "red"
-                    
-                    category_icon = "⚡" if tool.category == Category.STARTUP.value else "🛠️"
-                    
-                    tool_text = Text.assemble(
-                        (status_icon, status_color),
-                        (" ", ""),
-                        (category_icon, ""),
-                        (" ", ""),
-                        (f"{tool.alias}", "bold green" if tool.enabled else "dim red"),
-                        (" (", "dim"),
-                        (f"{tool.name}", "dim cyan"),
-                        (")", "dim"),
-                        (" - ", "dim"),
-                        (tool.description, "white")
-                    )
-                    
-                    group_node.add(tool_text)
-            
-            self.console.print(tree)
+
+            # Rebuild the tree only when the config actually changed
+            if self._tree_cache is None or self._tree_version != self.config.version:
+                self._tree_cache = self._build_tree()
+                self._tree_version = self.config.version
+
+            self.console.print(self._tree_cache)
             self.console.print()
             
             # Interactive options
@@ -545,9 +872,14 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             except Exception as e:
                 self.console.print(f"[red]Error: {e}[/red]")
                 break
-    
+
+        # Write all mutations from this session in one go
+        self.config.flush()
+
     def _toggle_tool_status(self) -> None:
         """Toggle enabled status of a specific tool."""
+        import inquirer
+
         if not self.config.tools:
             self.console.print("[yellow]No tools available.[/yellow]")
             return
@@ -577,15 +909,15 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             
             tool_name = answers["tool_name"]
             
-            # Find and toggle tool
-            for tool in self.config.tools:
-                if tool.name == tool_name:
-                    tool.enabled = not tool.enabled
-                    status = "enabled" if tool.enabled else "disabled"
-                    self.console.print(f"[green]✓ Tool '{tool.alias}' {status}[/green]")
-                    break
-            
-            self.config.save_config()
+            # Find and toggle tool; next() short-circuits the scan at
+            # C level instead of stepping a Python-level for/if/break
+            tool = next((t for t in self.config.tools if t.name == tool_name), None)
+            if tool is not None:
+                tool.enabled = not tool.enabled
+                status = "enabled" if tool.enabled else "disabled"
+                self.console.print(f"[green]✓ Tool '{tool.alias}' {status}[/green]")
+
+            self.config.mark_dirty()
             self.console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
             
@@ -596,8 +928,10 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
     
     def _toggle_group_status(self) -> None:
         """Toggle enabled status of an entire group."""
+        import inquirer
+
         # Get unique groups
-        groups = sorted(set(tool.group for tool in self.config.tools if tool.group))
+        groups = self.config.groups
         
         if not groups:
             self.console.print("[yellow]No groups defined.[/yellow]")
@@ -629,7 +963,7 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
                     toggled_count += 1
             
             self.console.print(f"[green]✓ Toggled {toggled_count} tools in group '{group_name}'[/green]")
-            self.config.save_config()
+            self.config.mark_dirty()
             self.console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
             
@@ -640,6 +974,8 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
     
     def _delete_tool(self) -> None:
         """Delete a specific tool."""
+        import inquirer
+
         if not self.config.tools:
             self.console.print("[yellow]No tools available.[/yellow]")
             self.console.print("\n[dim]Press Enter to continue...[/dim]")
@@ -683,8 +1019,7 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
                 return
             
             # Remove tool
-            self.config.tools = [t for t in self.config.tools if t.name != tool_name]
-            self.config.save_config()
+            self.config.remove_tool(tool_name)
             self.console.print(f"[green]✓ Tool '{tool_name}' deleted[/green]")
             self.console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
@@ -696,7 +1031,9 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
     
     def _delete_group(self) -> None:
         """Delete an entire group of tools."""
-        groups = sorted(set(tool.group for tool in self.config.tools if tool.group))
+        import inquirer
+
+        groups = self.config.groups
         
         if not groups:
             self.console.print("[yellow]No groups defined.[/yellow]")
@@ -737,8 +1074,7 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
                 return
             
             # Remove tools in group
-            self.config.tools = [t for t in self.config.tools if t.group != group_name]
-            self.config.save_config()
+            self.config.remove_group(group_name)
             self.console.print(f"[green]✓ Deleted {deleted_count} tools in group '{group_name}'[/green]")
             self.console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
@@ -750,20 +1086,39 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
     
     def add_tool_interactive(self) -> None:
         """Interactively add new tool(s)."""
+        try:
+            self._add_tools_loop()
+        finally:
+            # Write all additions from this session in one go
+            self.config.flush()
+
+    def _add_tools_loop(self) -> None:
+        """Run the interactive add loop until the user is done."""
+        import inquirer
+
+        # Question objects are reusable; build the static ones once per
+        # session instead of per loop iteration
+        questions = [
+            inquirer.Text(
+                "group",
+                message="Enter group name (leave empty for no group, or 'none' for existing)",
+                default=""
+            )
+        ]
+        another_tool_question = [
+            inquirer.Confirm(
+                "another",
+                message="Add another tool?",
+                default=False
+            )
+        ]
+
         while True:
             self.clear_screen()
             self.print_header()
             self.console.print("[bold cyan]Add New Tool[/bold cyan]\n")
-            
+
             # Ask for group
-            questions = [
-                inquirer.Text(
-                    "group",
-                    message="Enter group name (leave empty for no group, or 'none' for existing)",
-                    default=""
-                )
-            ]
-            
             try:
                 group_answer = inquirer.prompt(questions, theme=self.theme)
                 if not group_answer:
@@ -775,7 +1130,7 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Operation cancelled.[/yellow]")
                 return
-            except Exception as e:
+            except (EOFError, inquirer.errors.ValidationError) as e:
                 self.console.print(f"[red]Error: {e}[/red]")
                 return
             
@@ -786,22 +1141,24 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
                 if existing_tools_in_group:
                     self.console.print(f"[cyan]Found {len(existing_tools_in_group)} existing tools in group '{group_name}'[/cyan]")
             
+            # The message names the group, so this one is built per group
+            # rather than per tool added
+            continue_question = [
+                inquirer.Confirm(
+                    "continue",
+                    message=f"Add another tool to group '{group_name}'?",
+                    default=True
+                )
+            ] if group_name else None
+
             while True:
                 tool = self._add_single_tool(group_name)
                 if tool:
-                    self.config.tools.append(tool)
-                    self.config.save_config()
+                    self.config.add_tool(tool)
                     self.console.print(f"[green]✓ Tool '{tool.alias}' added successfully[/green]")
-                
+
                 # Ask if user wants to add another tool to the same group
                 if group_name:
-                    continue_question = [
-                        inquirer.Confirm(
-                            "continue",
-                            message=f"Add another tool to group '{group_name}'?",
-                            default=True
-                        )
-                    ]
                     try:
                         continue_answer = inquirer.prompt(continue_question, theme=self.theme)
                         if not continue_answer or not continue_answer["continue"]:
@@ -809,20 +1166,13 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
                     except KeyboardInterrupt:
                         self.console.print("\n[yellow]Operation cancelled.[/yellow]")
                         break
-                    except Exception as e:
+                    except (EOFError, inquirer.errors.ValidationError) as e:
                         self.console.print(f"[red]Error: {e}[/red]")
                         break
                 else:
                     break
             
             # Ask if user wants to add another tool (possibly in a different group)
-            another_tool_question = [
-                inquirer.Confirm(
-                    "another",
-                    message="Add another tool?",
-                    default=False
-                )
-            ]
             try:
                 another_answer = inquirer.prompt(another_tool_question, theme=self.theme)
                 if not another_answer or not another_answer["another"]:
@@ -830,105 +1180,126 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Operation cancelled.[/yellow]")
                 break
-            except Exception as e:
+            except (EOFError, inquirer.errors.ValidationError) as e:
                 self.console.print(f"[red]Error: {e}[/red]")
                 break
     
     def _add_single_tool(self, group_name: Optional[str] = None) -> Optional[Tool]:
         """Add a single tool with interactive prompts."""
+        import inquirer
+
         self.clear_screen()
         self.console.print("[bold cyan]Add New Tool[/bold cyan]\n")
-        
-        questions = [
-            inquirer.List(
-                "category",
-                message="Select tool category",
-                choices=[
-                    ("Startup (runs on shell startup)", Category.STARTUP.value),
-                    ("Tool (manual execution)", Category.TOOL.value)
-                ],
-                carousel=True
-            ),
-            inquirer.Path(
-                "path",
-                message="Enter tool path",
-                path_type=inquirer.Path.FILE,
-                exists=True
-            ),
-            inquirer.Text(
-                "alias",
-                message="Enter tool alias (name in PATH)",
-                validate=lambda _, x: bool(x.strip()) and not any(c in x for c in '/\\:?*"<>|')
-            ),
-            inquirer.Text(
-                "description",
-                message="Enter tool description"
-            )
-        ]
-        
+
+        if self._q_add_tool is None:
+            # Reject duplicate aliases inside the prompt, so a collision
+            # loops back to editing instead of tearing down the whole
+            # question chain; resolved through the live config so the
+            # cached questions never go stale
+            config = self.config
+
+            def _alias_is_free(answers, current: str) -> bool:
+                return (_validate_alias(answers, current)
+                        and config.get_tool_by_alias(current.strip()) is None)
+
+            self._q_add_tool = [
+                inquirer.List(
+                    "category",
+                    message="Select tool category",
+                    choices=[
+                        ("Startup (runs on shell startup)", Category.STARTUP.value),
+                        ("Tool (manual execution)", Category.TOOL.value)
+                    ],
+                    carousel=True
+                ),
+                # exists=True would stat the path on every re-validation;
+                # a plain validator checks it once with a single lexists
+                # call and also accepts ~-prefixed paths, which the
+                # symlink layer expands anyway
+                inquirer.Path(
+                    "path",
+                    message="Enter tool path",
+                    path_type=inquirer.Path.FILE,
+                    validate=_validate_tool_path
+                ),
+                inquirer.Text(
+                    "alias",
+                    message="Enter tool alias (name in PATH)",
+                    validate=_alias_is_free
+                ),
+                inquirer.Text(
+                    "description",
+                    message="Enter tool description"
+                )
+            ]
+
         try:
-            answers = inquirer.prompt(questions, theme=self.theme)
+            answers = inquirer.prompt(self._q_add_tool, theme=self.theme)
             if not answers:
                 return None
             
-            # Check if alias already exists
+            # Pull the answers into locals once instead of re-indexing the
+            # dict (and re-stripping) for every field below
             alias = answers["alias"].strip()
-            for tool in self.config.tools:
-                if tool.alias == alias:
-                    self.console.print(f"[red]Error: Alias '{alias}' already exists[/red]")
-                    self.console.print("\n[dim]Press Enter to continue...[/dim]")
-                    input()
-                    return None
-            
+            category = answers["category"]
+            path = answers["path"]
+            description = answers["description"].strip()
+
             # Create tool name from alias (replace non-alphanumeric with underscores)
-            name = re.sub(r'[^a-zA-Z0-9]', '_', alias)
-            
-            # Check if name already exists
-            existing_names = {t.name for t in self.config.tools}
-            counter = 1
+            name = _NON_ALNUM.sub('_', alias)
+
+            # Check if name already exists, resuming from the last free
+            # suffix recorded for this base name
             original_name = name
-            while name in existing_names:
+            counter = self.config._name_suffix_counter.get(original_name, 1)
+            while name in self.config._name_index:
                 name = f"{original_name}_{counter}"
                 counter += 1
+            self.config._name_suffix_counter[original_name] = counter
             
             tool = Tool(
                 name=name,
                 alias=alias,
-                category=answers["category"],
+                category=category,
                 group=group_name,
-                path=answers["path"],
-                description=answers["description"].strip(),
+                path=path,
+                description=description,
                 enabled=True
             )
             
-            # Show summary
+            # Show summary in a single buffered print (one terminal write
+            # instead of seven)
             self.clear_screen()
-            self.console.print("[bold cyan]Tool Summary[/bold cyan]\n")
-            self.console.print(f"  Name: {tool.name}")
-            self.console.print(f"  Alias: {tool.alias}")
-            self.console.print(f"  Category: {tool.category}")
-            self.console.print(f"  Group: {tool.group or 'None'}")
-            self.console.print(f"  Path: {tool.path}")
-            self.console.print(f"  Description: {tool.description}")
-            
-            confirm_question = [
-                inquirer.Confirm(
-                    "confirm",
-                    message="\nAdd this tool?",
-                    default=True
-                )
-            ]
+            summary = "\n".join([
+                "[bold cyan]Tool Summary[/bold cyan]\n",
+                f"  Name: {tool.name}",
+                f"  Alias: {tool.alias}",
+                f"  Category: {tool.category}",
+                f"  Group: {tool.group or 'None'}",
+                f"  Path: {tool.path}",
+                f"  Description: {tool.description}"
+            ])
+            self.console.print(summary)
             
-            confirm_answer = inquirer.prompt(confirm_question, theme=self.theme)
+            if self._q_confirm_add is None:
+                self._q_confirm_add = [
+                    inquirer.Confirm(
+                        "confirm",
+                        message="\nAdd this tool?",
+                        default=True
+                    )
+                ]
+
+            confirm_answer = inquirer.prompt(self._q_confirm_add, theme=self.theme)
             if not confirm_answer or not confirm_answer["confirm"]:
                 return None
-            
+
             return tool
             
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Operation cancelled.[/yellow]")
             return None
-        except Exception as e:
+        except (EOFError, inquirer.errors.ValidationError) as e:
             self.console.print(f"[red]Error: {e}[/red]")
             return None
     
@@ -941,68 +1312,66 @@ tmng is a tool manager for organizing and managing your scripts and binaries.
             self.config.update_symlinks()
             self.config.update_shell_conf()
         
-        self.console.print("[green]✓ Shell configuration updated[/green]")
-        self.console.print("[cyan]You may need to restart your shell or run:[/cyan]")
-        self.console.print("[bold]source ~/.bashrc[/bold] (or [bold]source ~/.zshrc[/bold])")
-        self.console.print("\n[dim]Press Enter to continue...[/dim]")
+        self.console.print("\n".join([
+            "[green]✓ Shell configuration updated[/green]",
+            "[cyan]You may need to restart your shell or run:[/cyan]",
+            "[bold]source ~/.bashrc[/bold] (or [bold]source ~/.zshrc[/bold])",
+            "\n[dim]Press Enter to continue...[/dim]"
+        ]))
         input()
 
+# Flag-to-attribute table for the hand-rolled CLI parser
+_FLAG_DESTS = {
+    "-h": "help", "--help": "help",
+    "-l": "list", "--list": "list",
+    "-a": "add", "--add": "add",
+    "-s": "stats", "--stats": "stats",
+    "--update-shell": "update_shell",
+}
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """Parse tmng's fixed flag set without argparse.
+
+    argparse drags gettext/textwrap into the import graph and builds a
+    full parser tree for five booleans and one option; this does the
+    same job in a dozen lines. Unknown arguments fall back to the help
+    screen, matching the old argparse error-exit behavior.
+    """
+    args = SimpleNamespace(help=False, list=False, add=False, stats=False,
+                           update_shell=False, config=None)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        dest = _FLAG_DESTS.get(arg)
+        if dest is not None:
+            setattr(args, dest, True)
+        elif arg == "--config":
+            i += 1
+            if i >= len(argv):
+                args.help = True
+                break
+            args.config = argv[i]
+        elif arg.startswith("--config="):
+            args.config = arg.split("=", 1)[1]
+        else:
+            args.help = True
+        i += 1
+    return args
+
 def main():
     """Main entry point for tmng."""
-    parser = argparse.ArgumentParser(
-        description="tmng - Tool Manager for organizing scripts and binaries",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False
-    )
-    
-    parser.add_argument(
-        "-h", "--help",
-        action="store_true",
-        help="Show this help message"
-    )
-    
-    parser.add_argument(
-        "-l", "--list",
-        action="store_true",
-        help="List and manage tools interactively"
-    )
-    
-    parser.add_argument(
-        "-a", "--add",
-        action="store_true",
-        help="Add new tool(s) interactively"
-    )
-    
-    parser.add_argument(
-        "-s", "--stats",
-        action="store_true",
-        help="Show statistics about managed tools"
-    )
-    
-    parser.add_argument(
-        "--update-shell",
-        action="store_true",
-        help="Update shell configuration manually"
-    )
-    
-    # Add config file option
-    parser.add_argument(
-        "--config",
-        type=str,
-        help="Use alternative configuration file"
-    )
-    
-    # Parse arguments
-    try:
-        args = parser.parse_args()
-    except SystemExit:
-        # Handle -h without arguments
-        manager = TmngManager()
-        manager.print_help()
+    args = _parse_args(sys.argv[1:])
+
+    # Help (explicit or no action flag at all) never needs a manager, so
+    # skip the config load and parse entirely on that path
+    if args.help or not (args.list or args.add or args.stats or args.update_shell):
+        print_help()
         return
-    
+
     # Initialize manager with optional config path
-    config_path = Path(args.config).expanduser().resolve() if args.config else None
+    # Only expand here; TmngConfig.__init__ resolves the path once, so
+    # resolving again in main would double the stat/readlink syscalls
+    config_path = Path(args.config).expanduser() if args.config else None
     manager = TmngManager(config_path)
     
     # Handle arguments
@@ -1014,8 +1383,6 @@ def main():
         manager.show_statistics()
     elif args.update_shell:
         manager.update_shell_config()
-    else:
-        manager.print_help()
 
 if __name__ == "__main__":
     try:
@@ -1024,6 +1391,6 @@ if __name__ == "__main__":
         print("\n[yellow]Operation cancelled by user.[/yellow]")
         sys.exit(0)
     except Exception as e:
-        console = Console()
+        console = _get_console()
         console.print(f"[bold red]Error: {e}[/bold red]")
         sys.exit(1)